@@ -1,19 +1,106 @@
 from google.cloud import texttospeech_v1beta1 as texttospeech
+from google.cloud.texttospeech_v1beta1.services.text_to_speech.transports import (
+    TextToSpeechGrpcTransport,
+)
+from google.cloud.texttospeech_v1beta1.services.text_to_speech.transports.base import (
+    DEFAULT_CLIENT_INFO,
+)
+from google.api_core import exceptions as core_exceptions
 from google.api_core.client_options import ClientOptions
-from handlers_and_protocols.protocols import TTSServiceHandler, EnvironmentHandler
+import grpc
+from handlers_and_protocols.protocols import BatchTTSServiceHandler, EnvironmentHandler
 from .google_environment_loader import GoogleEnvironmentHandler
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Tuple, Union
 import logging
+import threading
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# TTS clients shared across handler instances, keyed by server region.
+# Reusing a client keeps its gRPC channel (and TLS session) warm.
+_CLIENT_CACHE: Dict[str, texttospeech.TextToSpeechClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Keep the HTTP/2 connection alive through idle gaps between requests so
+# long batch jobs are not forced to reconnect and redo the TLS handshake
+_GRPC_CHANNEL_OPTIONS = {
+    "grpc.keepalive_time_ms": 30000,
+    "grpc.keepalive_timeout_ms": 5000,
+    "grpc.keepalive_permit_without_calls": 1,
+    "grpc.http2.max_pings_without_data": 0,
+    "grpc.max_send_message_length": -1,
+    "grpc.max_receive_message_length": -1,
+}
+
+
+# Batch calls go straight to the channel and decode only the audio
+# out of the response, skipping the proto-plus response wrapper
+_SYNTHESIZE_SPEECH_METHOD = (
+    "/google.cloud.texttospeech.v1beta1.TextToSpeech/SynthesizeSpeech"
+)
+_SYNTHESIZE_RESPONSE_PB = texttospeech.SynthesizeSpeechResponse.pb()
+
+
+def _audio_content_from_response(data: bytes) -> memoryview:
+    """Extract the audio from a serialized SynthesizeSpeechResponse"""
+    return memoryview(_SYNTHESIZE_RESPONSE_PB.FromString(data).audio_content)
+
+
+def _create_channel(host: str, **kwargs):
+    """Create the gRPC channel with keepalive options added to the defaults"""
+    options = dict(kwargs.pop("options", None) or [])
+    options.update(_GRPC_CHANNEL_OPTIONS)
+    return TextToSpeechGrpcTransport.create_channel(
+        host, options=list(options.items()), **kwargs
+    )
+
+
+def _build_transport(**kwargs) -> TextToSpeechGrpcTransport:
+    """Create the gRPC transport on top of the keepalive-enabled channel"""
+    return TextToSpeechGrpcTransport(channel=_create_channel, **kwargs)
+
+
+def _build_client(server_region: str) -> texttospeech.TextToSpeechClient:
+    """Create a TTS client for the given region"""
+    client_options = None
+    if server_region != "global":
+        API_ENDPOINT = f"{server_region}-texttospeech.googleapis.com"
+        client_options = ClientOptions(api_endpoint=API_ENDPOINT)
+    return texttospeech.TextToSpeechClient(
+        client_options=client_options, transport=_build_transport
+    )
+
+
+def _get_client(server_region: str) -> texttospeech.TextToSpeechClient:
+    """Return the shared TTS client for a region, creating it on first use"""
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(server_region)
+        if client is None:
+            client = _CLIENT_CACHE[server_region] = _build_client(server_region)
+        return client
+
 
 class AudioFormat(Enum):
     LINEAR16 = texttospeech.AudioEncoding.LINEAR16
     MP3 = texttospeech.AudioEncoding.MP3
+    OGG_OPUS = texttospeech.AudioEncoding.OGG_OPUS
+
+    @property
+    def file_extension(self) -> str:
+        """File extension used when saving audio in this encoding"""
+        return _FILE_EXTENSIONS[self]
+
+
+_FILE_EXTENSIONS = {
+    AudioFormat.LINEAR16: "wav",
+    AudioFormat.MP3: "mp3",
+    AudioFormat.OGG_OPUS: "ogg",
+}
 
 
 @dataclass
@@ -30,7 +117,34 @@ class GoogleAudioConfig:
     sample_rate: int = 24000
 
 
-class GoogleTTSModelHandler(TTSServiceHandler):
+# Request protos built from the (unchanging) voice/audio config are reused
+# across calls; synthesize_speech copies them and never mutates the originals
+@lru_cache(maxsize=32)
+def _voice_params(
+    voice_name: str, language_code: str
+) -> texttospeech.VoiceSelectionParams:
+    return texttospeech.VoiceSelectionParams(
+        name=voice_name,
+        language_code=language_code,
+    )
+
+
+@lru_cache(maxsize=32)
+def _audio_config_proto(
+    audio_encoding: texttospeech.AudioEncoding,
+    sample_rate: int,
+    speaking_rate: float,
+    volume_gain_db: float,
+) -> texttospeech.AudioConfig:
+    return texttospeech.AudioConfig(
+        audio_encoding=audio_encoding,
+        sample_rate_hertz=sample_rate,
+        speaking_rate=speaking_rate,
+        volume_gain_db=volume_gain_db,
+    )
+
+
+class GoogleTTSModelHandler(BatchTTSServiceHandler):
     def __init__(
         self,
         server_region: str = "global",
@@ -43,18 +157,17 @@ class GoogleTTSModelHandler(TTSServiceHandler):
             environment_handler.load_environment()
 
         self.server_region = server_region
+        self.tts_client = _get_client(server_region)
 
-        if self.server_region != "global":
-            API_ENDPOINT = f"{server_region}-texttospeech.googleapis.com"
-            self.tts_client = texttospeech.TextToSpeechClient(
-                client_options=ClientOptions(api_endpoint=API_ENDPOINT)
-            )
-        else:
-            self.tts_client = texttospeech.TextToSpeechClient()
+    def close(self) -> None:
+        """No-op: handlers and their clients are shared per process and region
+        (TTSPipeline reuses one handler across pipelines), so closing one must
+        not tear down the client the others are still using
+        """
 
     def synthesize_text(
         self,
-        text: str,
+        text: Union[str, bytes],
         voice_config: Optional[GoogleVoiceConfig] = None,
         audio_config: Optional[GoogleAudioConfig] = None,
         output_format: str = "mp3",
@@ -65,16 +178,13 @@ class GoogleTTSModelHandler(TTSServiceHandler):
             audio_config = GoogleAudioConfig()
 
         synthesis_input = texttospeech.SynthesisInput(text=text)
-        voice = texttospeech.VoiceSelectionParams(
-            name=voice_config.voice_name,
-            language_code=voice_config.language_code,
-        )
+        voice = _voice_params(voice_config.voice_name, voice_config.language_code)
 
-        audio_config_proto = texttospeech.AudioConfig(
-            audio_encoding=audio_config.format.value,
-            sample_rate_hertz=audio_config.sample_rate,
-            speaking_rate=voice_config.speaking_rate,
-            volume_gain_db=voice_config.volume_gain_db,
+        audio_config_proto = _audio_config_proto(
+            audio_config.format.value,
+            audio_config.sample_rate,
+            voice_config.speaking_rate,
+            voice_config.volume_gain_db,
         )
 
         response = self.tts_client.synthesize_speech(
@@ -97,16 +207,13 @@ class GoogleTTSModelHandler(TTSServiceHandler):
 
         synthesis_input = texttospeech.SynthesisInput(markup=markup_text)
 
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=voice_config.language_code,
-            name=voice_config.voice_name,
-        )
+        voice = _voice_params(voice_config.voice_name, voice_config.language_code)
 
-        audio_config_proto = texttospeech.AudioConfig(
-            audio_encoding=audio_config.format.value,
-            sample_rate_hertz=audio_config.sample_rate,
-            speaking_rate=voice_config.speaking_rate,
-            volume_gain_db=voice_config.volume_gain_db,
+        audio_config_proto = _audio_config_proto(
+            audio_config.format.value,
+            audio_config.sample_rate,
+            voice_config.speaking_rate,
+            voice_config.volume_gain_db,
         )
 
         response = self.tts_client.synthesize_speech(
@@ -115,6 +222,97 @@ class GoogleTTSModelHandler(TTSServiceHandler):
 
         return response.audio_content
 
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        voice_config: Optional[GoogleVoiceConfig] = None,
+        audio_config: Optional[GoogleAudioConfig] = None,
+        max_in_flight: int = 8,
+    ) -> List[Future]:
+        """
+        Start synthesis of several texts over the shared gRPC channel
+
+        Requests are issued as non-blocking unary calls multiplexed on one
+        HTTP/2 connection, with at most max_in_flight outstanding, so the
+        batch needs no thread per request.
+
+        The calls go straight to the transport's raw channel, so they bypass
+        the client's interceptors, including its debug request logging.
+
+        Args:
+            texts: Texts to convert to speech
+            voice_config: Voice configuration object
+            audio_config: Audio configuration object
+            max_in_flight: Maximum number of concurrent requests
+
+        Returns:
+            One future per text, in input order, resolving to a memoryview
+            of the audio content
+        """
+        if voice_config is None:
+            voice_config = GoogleVoiceConfig()
+        if audio_config is None:
+            audio_config = GoogleAudioConfig()
+
+        voice = _voice_params(voice_config.voice_name, voice_config.language_code)
+        audio_config_proto = _audio_config_proto(
+            audio_config.format.value,
+            audio_config.sample_rate,
+            voice_config.speaking_rate,
+            voice_config.volume_gain_db,
+        )
+        requests = [
+            texttospeech.SynthesizeSpeechRequest(
+                input=texttospeech.SynthesisInput(text=text),
+                voice=voice,
+                audio_config=audio_config_proto,
+            )
+            for text in texts
+        ]
+
+        results: List[Future] = [Future() for _ in requests]
+        pending = iter(enumerate(requests))
+        pending_lock = threading.Lock()
+        # Clients are always built on the gRPC transport (see _build_transport)
+        transport = self.tts_client.transport
+        assert isinstance(transport, TextToSpeechGrpcTransport)
+        stub = transport.grpc_channel.unary_unary(
+            _SYNTHESIZE_SPEECH_METHOD,
+            request_serializer=texttospeech.SynthesizeSpeechRequest.serialize,
+            response_deserializer=_audio_content_from_response,
+        )
+        metadata = [DEFAULT_CLIENT_INFO.to_grpc_metadata()]
+
+        def start_next() -> None:
+            while True:
+                with pending_lock:
+                    item = next(pending, None)
+                if item is None:
+                    return
+                i, request = item
+                try:
+                    call = stub.future(request, metadata=metadata)
+                except Exception as e:
+                    results[i].set_exception(e)
+                    continue
+                call.add_done_callback(partial(on_done, i))
+                return
+
+        def on_done(i: int, call) -> None:
+            try:
+                results[i].set_result(call.result())
+            except grpc.RpcError as e:
+                results[i].set_exception(core_exceptions.from_grpc_error(e))
+            except Exception as e:
+                results[i].set_exception(e)
+            # Keep the window full: each finished call starts the next one
+            start_next()
+
+        for _ in range(min(max_in_flight, len(requests))):
+            start_next()
+
+        return results
+
     def get_available_voices(self, language_code: str = "en-US") -> list:
         """Get list of available voices for a language"""
         voices = self.tts_client.list_voices(language_code=language_code)
@@ -136,26 +334,34 @@ class GoogleTTSModelHandler(TTSServiceHandler):
 class GoogleVoicePresets:
     """Predefined voice configurations for Google Chirp 3 models"""
 
-    @staticmethod
-    def confident_male() -> GoogleVoiceConfig:
-        return GoogleVoiceConfig(
+    _PRESETS: Dict[str, GoogleVoiceConfig] = {
+        "confident_male": GoogleVoiceConfig(
             voice_name="en-US-Chirp3-HD-Charon", speaking_rate=0.9, volume_gain_db=2.0
-        )
-
-    @staticmethod
-    def professional_female() -> GoogleVoiceConfig:
-        return GoogleVoiceConfig(
+        ),
+        "professional_female": GoogleVoiceConfig(
             voice_name="en-US-Chirp3-HD-Leda", speaking_rate=0.9, volume_gain_db=1.0
-        )
-
-    @staticmethod
-    def authoritative_neutral() -> GoogleVoiceConfig:
-        return GoogleVoiceConfig(
+        ),
+        "authoritative_neutral": GoogleVoiceConfig(
             voice_name="en-US-Chirp3-HD-Charon", speaking_rate=0.85, volume_gain_db=3.0
-        )
-
-    @staticmethod
-    def fast_review() -> GoogleVoiceConfig:
-        return GoogleVoiceConfig(
+        ),
+        "fast_review": GoogleVoiceConfig(
             voice_name="en-US-Chirp3-HD-Leda", speaking_rate=2.0, volume_gain_db=1.0
-        )
+        ),
+    }
+
+    # Presets are static, so the Chirp 3 subset is computed once here
+    _CHIRP3_NAMES: Tuple[str, ...] = tuple(
+        name
+        for name, config in _PRESETS.items()
+        if "chirp3" in config.voice_name.lower()
+    )
+
+    @classmethod
+    def get(cls, name: str) -> GoogleVoiceConfig:
+        """Return a copy of the named preset"""
+        return replace(cls._PRESETS[name])
+
+    @classmethod
+    def chirp3_names(cls) -> Tuple[str, ...]:
+        """Names of the presets that use Chirp 3 voices"""
+        return cls._CHIRP3_NAMES
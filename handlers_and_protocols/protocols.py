@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import Future
+from typing import Any, List, Union
 
 
 class EnvironmentHandler(ABC):
@@ -15,7 +16,7 @@ class TTSServiceHandler(ABC):
     @abstractmethod
     def synthesize_text(
         self,
-        text: str,
+        text: Union[str, bytes],
         voice_config: Any = None,
         audio_config: Any = None,
         output_format: str = "mp3",
@@ -24,7 +25,7 @@ class TTSServiceHandler(ABC):
         Synthesizes speech from text input
 
         Args:
-            text: Text to convert to speech
+            text: Text to convert to speech, or its UTF-8 encoded bytes
             voice_config: Voice configuration object
             audio_config: Audio configuration object
             output_format: Output audio format
@@ -62,10 +63,37 @@ class TTSServiceHandler(ABC):
         pass
 
 
+class BatchTTSServiceHandler(TTSServiceHandler):
+    @abstractmethod
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        voice_config: Any = None,
+        audio_config: Any = None,
+        max_in_flight: int = 8,
+    ) -> List[Future]:
+        """
+        Starts synthesis of several texts without blocking
+
+        Args:
+            texts: Texts to convert to speech
+            voice_config: Voice configuration object
+            audio_config: Audio configuration object
+            max_in_flight: Maximum number of concurrent requests
+
+        Returns:
+            One future per text, in input order, resolving to the audio content
+        """
+        pass
+
+
 class AudioProcessorHandler(ABC):
     @abstractmethod
     def save_audio(
-        self, audio_content: bytes, filename: str, format: str = "wav"
+        self,
+        audio_content: Union[bytes, memoryview],
+        filename: str,
+        format: str = "wav",
     ) -> str:
         """Save audio content to file"""
         pass
@@ -1,22 +1,24 @@
 #!/usr/bin/env python3
+import atexit
 import click
+import logging
+import logging.handlers
+import queue
 from src.pipeline import TTSPipeline
 from adapters.google_adapters.google_tts_adapter import GoogleVoicePresets
 from pathlib import Path
 
 
-def get_available_chirp3_presets():
-    """Get list of available Chirp 3 voice presets"""
-    presets = []
-    for name in dir(GoogleVoicePresets):
-        if not name.startswith("_") and callable(getattr(GoogleVoicePresets, name)):
-            try:
-                config = getattr(GoogleVoicePresets, name)()
-                if "chirp3" in config.voice_name.lower():
-                    presets.append(name)
-            except:
-                pass
-    return presets
+def setup_logging():
+    """Route log records through a queue so worker threads never block on output"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
 
 
 @click.command()
@@ -34,7 +36,7 @@ def get_available_chirp3_presets():
     "--voice",
     "-v",
     default="professional_female",
-    type=click.Choice(get_available_chirp3_presets()),
+    type=click.Choice(GoogleVoicePresets.chirp3_names()),
     help="Voice preset to use",
 )
 @click.option(
@@ -50,7 +52,43 @@ def get_available_chirp3_presets():
     type=click.Choice(["google"]),
     help="TTS service provider",
 )
-def main(docx_file, output_name, voice, batch, region, service):
+@click.option(
+    "--fast-parse",
+    is_flag=True,
+    help="Read the DOCX with a streaming XML parser (faster on large documents)",
+)
+@click.option(
+    "--single-format",
+    is_flag=True,
+    help="Use only the first Q&A format found in the document (faster extraction)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "audio_format",
+    default="mp3",
+    type=click.Choice(["mp3", "opus"]),
+    help="Audio output format (opus files are about half the size)",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Maximum number of synthesis requests sent at once",
+)
+def main(
+    docx_file,
+    output_name,
+    voice,
+    batch,
+    region,
+    service,
+    fast_parse,
+    single_format,
+    audio_format,
+    concurrency,
+):
     """
     Convert Q&A from DOCX file to high-quality speech audio using Google Chirp 3
 
@@ -60,12 +98,13 @@ def main(docx_file, output_name, voice, batch, region, service):
         python main.py interview_questions.docx
         python main.py questions.docx --voice confident_male --batch
         python main.py prep.docx -o leadership_prep -v professional_female
+        python main.py prep.docx --format opus
     """
 
     # Validate voice preset exists
-    if not hasattr(GoogleVoicePresets, voice):
+    if voice not in GoogleVoicePresets.chirp3_names():
         click.echo(f"❌ Error: Voice preset '{voice}' not found")
-        click.echo(f"Available presets: {', '.join(get_available_chirp3_presets())}")
+        click.echo(f"Available presets: {', '.join(GoogleVoicePresets.chirp3_names())}")
         return
 
     # Convert relative path to absolute if needed
@@ -74,7 +113,12 @@ def main(docx_file, output_name, voice, batch, region, service):
     try:
         # Initialize pipeline
         click.echo(f"🔧 Initializing {service.upper()} TTS pipeline...")
-        pipeline = TTSPipeline(service=service, server_region=region)
+        pipeline = TTSPipeline(
+            service=service,
+            server_region=region,
+            fast_parse=fast_parse,
+            max_concurrency=concurrency,
+        )
 
         # Process document
         click.echo(f"📄 Processing document: {docx_path.name}")
@@ -91,6 +135,8 @@ def main(docx_file, output_name, voice, batch, region, service):
             output_name=output_name,
             voice_preset=voice,
             batch_mode=batch,
+            audio_format=audio_format,
+            first_format_only=single_format,
         )
 
         # Display results
@@ -184,6 +230,8 @@ if __name__ == "__main__":
     # If called directly, run the main convert command
     import sys
 
+    setup_logging()
+
     if len(sys.argv) == 1:
         click.echo("📚 TTS Pipeline - Text to Speech for Interview Prep")
         click.echo("Usage: python main.py [DOCX_FILE] [OPTIONS]")
@@ -1,30 +1,74 @@
+import fnmatch
+import hashlib
+import logging
 import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Any
-from handlers_and_protocols.protocols import TTSServiceHandler
+from typing import List, Any, Dict, Optional, Set, Tuple, Union
+from handlers_and_protocols.protocols import BatchTTSServiceHandler, TTSServiceHandler
+
+logger = logging.getLogger(__name__)
+
+# Filename sanitization patterns, compiled once at import
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE = re.compile(r"\s+")
+
+_AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".ogg"})
 
 
 class AudioProcessor:
     """Versatile processor for handling audio file operations and batch processing"""
 
-    def __init__(self, output_dir: str = "output"):
+    # Directories already created in this process, shared by all instances
+    _created_dirs: Set[Path] = set()
+
+    def __init__(
+        self,
+        output_dir: str = "output",
+        cache_dir: Optional[str] = None,
+        cache_enabled: bool = True,
+        max_concurrency: int = 8,
+    ):
         """
         Initialize audio processor
 
         Args:
             output_dir: Directory for output files
+            cache_dir: Directory for cached synthesis results
+                (default: <output_dir>/.tts_cache)
+            cache_enabled: Reuse cached audio instead of re-synthesizing
+            max_concurrency: Maximum number of synthesis requests in flight
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self.max_concurrency = max_concurrency
+
+        self.cache_enabled = cache_enabled
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir is not None else self.output_dir / ".tts_cache"
+        )
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory on first use instead of on every instantiation"""
+        if path not in AudioProcessor._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            AudioProcessor._created_dirs.add(path)
 
     def save_audio(
-        self, audio_content: bytes, filename: str, format: str = "mp3"
+        self,
+        audio_content: Union[bytes, memoryview],
+        filename: str,
+        format: str = "mp3",
     ) -> str:
         """
         Save audio content to file
 
         Args:
-            audio_content: Audio bytes from TTS service
+            audio_content: Audio bytes (or a memoryview of them) from TTS service
             filename: Output filename (without extension)
             format: Audio format (wav, mp3, etc.)
 
@@ -35,20 +79,76 @@ class AudioProcessor:
         safe_filename = self._sanitize_filename(filename)
         output_path = self.output_dir / f"{safe_filename}.{format}"
 
+        return self._save_to_path(audio_content, output_path)
+
+    def _save_to_path(
+        self, audio_content: Union[bytes, memoryview], output_path: Path
+    ) -> str:
+        """
+        Save audio content to an already-safe path in the output directory
+
+        Args:
+            audio_content: Audio bytes (or a memoryview of them) from TTS service
+            output_path: Destination path, used as-is without sanitizing
+
+        Returns:
+            Full path to saved file
+        """
         try:
-            with open(output_path, "wb") as audio_file:
-                audio_file.write(audio_content)
+            self._write_in_dir(self.output_dir, output_path, audio_content)
 
             return str(output_path)
         except Exception as e:
             raise IOError(f"Error saving audio file {output_path}: {str(e)}")
 
+    def _write_in_dir(
+        self, directory: Path, path: Path, data: Union[bytes, memoryview]
+    ) -> None:
+        """
+        Write a file into a directory, creating the directory on first use
+
+        Args:
+            directory: Directory that contains path
+            path: Destination file path
+            data: Bytes or memoryview to write
+        """
+        self._ensure_dir(directory)
+        try:
+            self._write_file(path, data)
+        except FileNotFoundError:
+            # The directory was removed since it was created (or a relative
+            # path now resolves elsewhere after a chdir), so create it again
+            AudioProcessor._created_dirs.discard(directory)
+            self._ensure_dir(directory)
+            self._write_file(path, data)
+
+    def _write_file(self, path: Path, data: Union[bytes, memoryview]) -> None:
+        """
+        Write audio data straight to a file descriptor
+
+        Writes go through os.write on a memoryview, so partial writes are
+        resumed without slicing (and copying) the underlying buffer.
+
+        Args:
+            path: Destination file path
+            data: Bytes or memoryview to write
+        """
+        view = memoryview(data)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
     def create_batch_files(
         self,
         qa_pairs: List[Any],
         tts_handler: TTSServiceHandler,
         voice_config: Any = None,
         filename_prefix: str = "qa_pair",
+        audio_config: Any = None,
+        format: str = "mp3",
     ) -> List[str]:
         """
         Create separate audio files for each Q&A pair
@@ -57,34 +157,19 @@ class AudioProcessor:
             qa_pairs: List of Q&A pair objects
             tts_handler: TTS service handler instance
             voice_config: Voice configuration object
-            audio_config: Audio configuration object
             filename_prefix: Prefix for output filenames
+            audio_config: Audio configuration object
+            format: Audio file extension, matching the audio config encoding
 
         Returns:
             List of paths to created audio files
         """
-        file_paths = []
-
-        for i, qa in enumerate(qa_pairs, 1):
-            try:
-                # Create text for this Q&A
-                text = f"Question: {qa.question}. Answer: {qa.answer}."
-
-                # Generate audio using the TTS handler
-                audio_content = tts_handler.synthesize_text(text, voice_config)
-                # audio_content = synthesize_bypass(text)
-                # Create filename
-                filename = f"{filename_prefix}_{i:03d}"
-
-                # Save file
-                file_path = self.save_audio(audio_content, filename)
-                file_paths.append(file_path)
-
-            except Exception as e:
-                print(f"Warning: Failed to create audio for Q&A pair {i}: {str(e)}")
-                continue
+        # Create text for each Q&A
+        texts = [f"Question: {qa.question}. Answer: {qa.answer}." for qa in qa_pairs]
 
-        return file_paths
+        return self._create_files(
+            texts, tts_handler, voice_config, audio_config, filename_prefix, format
+        )
 
     def create_batch_files_with_markup(
         self,
@@ -93,6 +178,7 @@ class AudioProcessor:
         voice_config: Any = None,
         audio_config: Any = None,
         filename_prefix: str = "qa_pair",
+        format: str = "mp3",
     ) -> List[str]:
         """
         Create separate audio files for each Q&A pair using markup synthesis
@@ -103,34 +189,355 @@ class AudioProcessor:
             voice_config: Voice configuration object
             audio_config: Audio configuration object
             filename_prefix: Prefix for output filenames
+            format: Audio file extension, matching the audio config encoding
+
+        Returns:
+            List of paths to created audio files
+        """
+        # Create markup text for each Q&A with pauses
+        texts = [
+            f"Question: [pause short] {qa.question}. [pause medium] Answer: [pause short] {qa.answer}."
+            for qa in qa_pairs
+        ]
+
+        return self._create_files(
+            texts, tts_handler, voice_config, audio_config, filename_prefix, format
+        )
+
+    def create_text_files(
+        self,
+        texts: List[str],
+        tts_handler: TTSServiceHandler,
+        voice_config: Any = None,
+        audio_config: Any = None,
+        filename_prefix: str = "text",
+        format: str = "mp3",
+    ) -> List[str]:
+        """
+        Create one audio file per text, such as pre-chunked speech text
+
+        Args:
+            texts: Texts to synthesize, in output order
+            tts_handler: TTS service handler instance
+            voice_config: Voice configuration object
+            audio_config: Audio configuration object
+            filename_prefix: Prefix for output filenames
+            format: Audio file extension, matching the audio config encoding
 
         Returns:
             List of paths to created audio files
         """
-        file_paths = []
+        return self._create_files(
+            texts, tts_handler, voice_config, audio_config, filename_prefix, format
+        )
+
+    def _create_files(
+        self,
+        texts: List[str],
+        tts_handler: TTSServiceHandler,
+        voice_config: Any = None,
+        audio_config: Any = None,
+        filename_prefix: str = "qa_pair",
+        format: str = "mp3",
+    ) -> List[str]:
+        """
+        Synthesize and save one audio file per text, running requests concurrently
 
-        for i, qa in enumerate(qa_pairs, 1):
-            try:
-                # Create markup text for this Q&A with pauses
-                markup_text = f"Question: [pause short] {qa.question}. [pause medium] Answer: [pause short] {qa.answer}."
+        Args:
+            texts: Texts to synthesize, in output order
+            tts_handler: TTS service handler instance
+            voice_config: Voice configuration object
+            audio_config: Audio configuration object
+            filename_prefix: Prefix for output filenames
+            format: Audio file extension
 
-                # Generate audio using markup synthesis
-                audio_content = tts_handler.synthesize_text(
-                    markup_text, voice_config, audio_config
+        Returns:
+            List of paths to created audio files, in input order
+        """
+
+        # Group output indices by text so duplicate Q&As are synthesized once.
+        # Voice and audio config are shared by the whole batch, so the text
+        # alone identifies the request here.
+        indices_by_text: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts, 1):
+            indices_by_text.setdefault(text, []).append(i)
+
+        # Build every output path up front: the prefix is sanitized once and
+        # the numbered suffix is always safe, so the save loop skips the regexes
+        safe_prefix = self._sanitize_filename(filename_prefix)
+        output_paths = [
+            self.output_dir / f"{safe_prefix}_{i:03d}.{format}"
+            for i in range(1, len(texts) + 1)
+        ]
+
+        def save_all(
+            audio_content: Union[bytes, memoryview],
+            indices: List[int],
+            cache_text: Optional[str] = None,
+        ) -> Dict[int, str]:
+            # Fresh batch results are cached here, before this method returns,
+            # rather than on gRPC's completion thread
+            if cache_text is not None:
+                self._write_cache(cache_text, voice_config, audio_config, audio_content)
+            paths = {}
+            for i in indices:
+                try:
+                    paths[i] = self._save_to_path(audio_content, output_paths[i - 1])
+                except Exception as e:
+                    logger.warning("Failed to create audio for Q&A pair %d: %s", i, e)
+            return paths
+
+        saved: Dict[int, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # Each future resolves to the audio for one unique text
+            uncached: Set[str] = set()
+            if isinstance(tts_handler, BatchTTSServiceHandler):
+                synth_futures, misses = self._submit_batch(
+                    list(indices_by_text), tts_handler, voice_config, audio_config
                 )
+                if self.cache_enabled:
+                    uncached.update(misses)
+            else:
+                synth_futures = {
+                    executor.submit(
+                        self._synthesize_cached,
+                        text,
+                        tts_handler,
+                        voice_config,
+                        audio_config,
+                    ): text
+                    for text in indices_by_text
+                }
+
+            save_futures = []
+            for future in as_completed(synth_futures):
+                # Pop so the audio buffer is released once its files are saved
+                text = synth_futures.pop(future)
+                indices = indices_by_text[text]
+                try:
+                    audio_content = future.result()
+                except Exception as e:
+                    for i in indices:
+                        logger.warning(
+                            "Failed to create audio for Q&A pair %d: %s", i, e
+                        )
+                    continue
+                cache_text = text if text in uncached else None
+                save_futures.append(
+                    executor.submit(save_all, audio_content, indices, cache_text)
+                )
+                del audio_content
+
+            for future in save_futures:
+                saved.update(future.result())
+
+        return [saved[i] for i in sorted(saved)]
+
+    def _submit_batch(
+        self,
+        texts: List[str],
+        tts_handler: BatchTTSServiceHandler,
+        voice_config: Any = None,
+        audio_config: Any = None,
+    ) -> Tuple[Dict[Future, str], List[str]]:
+        """
+        Synthesize texts through the handler's batch API, skipping cached ones
 
-                # Create filename
-                filename = f"{filename_prefix}_{i:03d}"
+        Args:
+            texts: Unique texts to synthesize
+            tts_handler: TTS service handler with a batch API
+            voice_config: Voice configuration object
+            audio_config: Audio configuration object
 
-                # Save file
-                file_path = self.save_audio(audio_content, filename)
-                file_paths.append(file_path)
+        Returns:
+            Mapping of futures (resolving to audio bytes) to their text, and
+            the texts that were not found in the cache
+        """
+        futures: Dict[Future, str] = {}
+        misses = []
 
-            except Exception as e:
-                print(f"Warning: Failed to create audio for Q&A pair {i}: {str(e)}")
+        for text in texts:
+            cached = self._read_cache(text, voice_config, audio_config)
+            if cached is None:
+                misses.append(text)
                 continue
+            future: Future = Future()
+            future.set_result(cached)
+            futures[future] = text
 
-        return file_paths
+        if misses:
+            batch = tts_handler.synthesize_batch(
+                misses, voice_config, audio_config, max_in_flight=self.max_concurrency
+            )
+            for text, future in zip(misses, batch):
+                futures[future] = text
+
+        return futures, misses
+
+    def _cache_key(
+        self, text: str, voice_config: Any = None, audio_config: Any = None
+    ) -> str:
+        """
+        Build a content-addressed key for a synthesis request
+
+        Args:
+            text: Text sent to the TTS service
+            voice_config: Voice configuration object
+            audio_config: Audio configuration object
+
+        Returns:
+            SHA-256 hex digest of the request parameters
+        """
+        # Config dataclasses have a field-by-field repr, which makes a
+        # stable description of everything that affects the audio output
+        canonical = repr((text, voice_config, audio_config))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _cache_path(
+        self, text: str, voice_config: Any = None, audio_config: Any = None
+    ) -> Path:
+        """Location of the cache entry for a synthesis request"""
+        # The key already covers the encoding, so one neutral suffix fits
+        # every audio format
+        cache_key = self._cache_key(text, voice_config, audio_config)
+        return self.cache_dir / f"{cache_key}.audio"
+
+    def _read_cache(
+        self, text: str, voice_config: Any = None, audio_config: Any = None
+    ) -> Optional[bytes]:
+        """
+        Look up previously synthesized audio
+
+        Returns:
+            Cached audio bytes, or None on a miss (or when caching is disabled)
+        """
+        if not self.cache_enabled:
+            return None
+
+        try:
+            with open(self._cache_path(text, voice_config, audio_config), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_cache(
+        self,
+        text: str,
+        voice_config: Any,
+        audio_config: Any,
+        audio_content: Union[bytes, memoryview],
+    ) -> None:
+        """Store synthesized audio in the cache"""
+        cache_path = self._cache_path(text, voice_config, audio_config)
+
+        # Write to a temporary file first so an interrupted run never
+        # leaves a truncated entry behind
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self._write_in_dir(self.cache_dir, tmp_path, audio_content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not cache audio %s: %s", cache_path, e)
+            tmp_path.unlink(missing_ok=True)
+
+    def _synthesize_cached(
+        self,
+        text: str,
+        tts_handler: TTSServiceHandler,
+        voice_config: Any = None,
+        audio_config: Any = None,
+    ) -> bytes:
+        """
+        Synthesize text, reusing audio from the on-disk cache when available
+
+        Args:
+            text: Text to convert to speech
+            tts_handler: TTS service handler instance
+            voice_config: Voice configuration object
+            audio_config: Audio configuration object
+
+        Returns:
+            Audio content as bytes
+        """
+        cached = self._read_cache(text, voice_config, audio_config)
+        if cached is not None:
+            return cached
+
+        audio_content = tts_handler.synthesize_text(text, voice_config, audio_config)
+        if self.cache_enabled:
+            self._write_cache(text, voice_config, audio_config, audio_content)
+
+        return audio_content
+
+    def combine_audio_files(
+        self,
+        file_paths: List[str],
+        output_name: str,
+        format: str = "mp3",
+    ) -> str:
+        """
+        Concatenate audio files into one
+
+        ffmpeg's concat demuxer joins the files by copying their encoded
+        frames, without decoding and re-encoding the audio.
+
+        Args:
+            file_paths: Audio files to combine, in playback order
+            output_name: Output filename (without extension)
+            format: Audio format of the input files and of the output
+
+        Returns:
+            Full path to the combined file
+
+        Raises:
+            FileNotFoundError: If ffmpeg is not on PATH
+        """
+        if shutil.which("ffmpeg") is None:
+            raise FileNotFoundError("ffmpeg is required to combine audio files")
+
+        safe_filename = self._sanitize_filename(output_name)
+        output_path = self.output_dir / f"{safe_filename}.{format}"
+        self._ensure_dir(self.output_dir)
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            # Quotes inside a path are escaped as '\'' in the concat list
+            concat_path = Path(work_dir) / "concat.txt"
+            concat_path.write_text(
+                "".join(
+                    "file '{}'\n".format(
+                        str(Path(file_path).resolve()).replace("'", "'\\''")
+                    )
+                    for file_path in file_paths
+                ),
+                encoding="utf-8",
+            )
+
+            self._run_ffmpeg(
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                str(concat_path),
+                "-c",
+                "copy",
+                str(output_path),
+            )
+
+        return str(output_path)
+
+    def _run_ffmpeg(self, *args: str) -> None:
+        """Run ffmpeg with the given arguments, overwriting its output file"""
+        command = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", *args]
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+        except subprocess.CalledProcessError as e:
+            raise IOError(
+                f"ffmpeg failed: {e.stderr.decode('utf-8', 'replace').strip()}"
+            )
 
     def get_output_info(self) -> dict:
         """
@@ -142,16 +549,25 @@ class AudioProcessor:
         if not self.output_dir.exists():
             return {"exists": False, "file_count": 0, "total_size_mb": 0}
 
-        files = list(self.output_dir.glob("*"))
-        audio_files = [f for f in files if f.suffix.lower() in [".wav", ".mp3", ".ogg"]]
+        total_files = 0
+        audio_files = 0
+        total_size = 0
 
-        total_size = sum(f.stat().st_size for f in files if f.is_file())
+        # Single directory pass; DirEntry caches type info from the scan
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                total_files += 1
+                total_size += entry.stat(follow_symlinks=False).st_size
+                if os.path.splitext(entry.name)[1].lower() in _AUDIO_EXTENSIONS:
+                    audio_files += 1
 
         return {
             "exists": True,
             "path": str(self.output_dir),
-            "total_files": len(files),
-            "audio_files": len(audio_files),
+            "total_files": total_files,
+            "audio_files": audio_files,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
         }
 
@@ -167,13 +583,21 @@ class AudioProcessor:
         """
         deleted_count = 0
 
-        for file_path in self.output_dir.glob(file_pattern):
-            if file_path.is_file():
+        try:
+            entries = os.scandir(self.output_dir)
+        except FileNotFoundError:
+            return 0
+
+        # DirEntry already knows each entry's type, so only unlink hits the disk
+        with entries:
+            for entry in entries:
+                if not entry.is_file() or not fnmatch.fnmatch(entry.name, file_pattern):
+                    continue
                 try:
-                    file_path.unlink()
+                    os.unlink(entry.path)
                     deleted_count += 1
-                except Exception as e:
-                    print(f"Warning: Could not delete {file_path}: {str(e)}")
+                except OSError as e:
+                    logger.warning("Could not delete %s: %s", entry.path, e)
 
         return deleted_count
 
@@ -187,13 +611,9 @@ class AudioProcessor:
         Returns:
             Sanitized filename
         """
-        # Remove or replace problematic characters
-        import re
-
         # Replace spaces and special characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', "_", filename)
-        sanitized = re.sub(r"\s+", "_", sanitized)
-        sanitized = sanitized.strip("._")
+        sanitized = _UNSAFE_FILENAME_CHARS.sub("_", filename)
+        sanitized = _WHITESPACE.sub("_", sanitized).strip("._")
 
         # Ensure it's not too long
         if len(sanitized) > 200:
@@ -219,6 +639,7 @@ class AudioProcessor:
             Path to created playlist file
         """
         playlist_path = self.output_dir / f"{playlist_name}.m3u"
+        self._ensure_dir(self.output_dir)
 
         with open(playlist_path, "w", encoding="utf-8") as f:
             f.write("#EXTM3U\n")
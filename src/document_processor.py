@@ -1,10 +1,55 @@
 from docx import Document
 import re
-from typing import List, Dict, Optional
+import zipfile
+from typing import IO, Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
-
-@dataclass
+# WordprocessingML tags used by the streaming reader
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_HYPERLINK = f"{_W}hyperlink"
+_W_T = f"{_W}t"
+_W_BR = f"{_W}br"
+_W_TYPE = f"{_W}type"
+
+# Run children with a fixed text equivalent (matching python-docx)
+_RUN_SPECIAL_CHARS = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
+# Single-pass cleanup applied to every extracted question and answer. The
+# alternatives are ordered so one scan gives the same result as normalizing
+# whitespace, then quotes (curly double quotes become straight ones), then
+# dashes, then dropping a leading bullet and number: quotes and dashes absorb
+# the whitespace around them, a leading bullet may be followed by a number,
+# and single spaces are left unmatched.
+# The leading lookahead lets ordinary characters be skipped without trying
+# each alternative.
+_CLEAN_RE = re.compile(
+    r'(?=[\s"“”–—•·▪▫\d])'
+    r'(?:(?P<quote>\s*["“”]\s*)'
+    r"|(?P<dash>\s*[–—]\s*)"
+    r"|(?P<lead>\A(?:[•·▪▫]\s*)?\d+[\.\)]\s*|\A[•·▪▫]\s*)"
+    r"|(?P<ws> \s+|[^\S ]\s*))"
+)
+_CLEAN_REPLACEMENTS = {"quote": '"', "dash": " - ", "lead": "", "ws": " "}
+
+_WS_RUN_RE = re.compile(r"\s*")
+
+
+def _clean_replacement(match: re.Match) -> str:
+    """Replacement text for a _CLEAN_RE match"""
+    # Every alternative is a named group, so one of them always matched
+    assert match.lastgroup is not None
+    return _CLEAN_REPLACEMENTS[match.lastgroup]
+
+
+@dataclass(slots=True)
 class QAPair:
     """Represents a question-answer pair"""
 
@@ -13,18 +58,122 @@ class QAPair:
     category: str = "general"
 
 
+class FastDocxReader:
+    """Streaming DOCX text reader that walks word/document.xml with lxml iterparse"""
+
+    def read(self, file_path: str) -> str:
+        """
+        Extract all text from DOCX file without building a document object model
+
+        Produces the same text as DocumentProcessor.read_docx: top-level body
+        paragraphs, empty ones skipped, joined by newlines.
+
+        Args:
+            file_path: Path to DOCX file
+
+        Returns:
+            Full text content as string
+        """
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                with archive.open("word/document.xml") as stream:
+                    return "\n".join(self.iter_paragraphs(stream))
+        except Exception as e:
+            raise ValueError(f"Error reading DOCX file {file_path}: {str(e)}")
+
+    def iter_paragraphs(self, stream: IO[bytes]) -> Iterator[str]:
+        """
+        Yield the text of each non-empty top-level paragraph
+
+        Args:
+            stream: File object for word/document.xml
+
+        Returns:
+            Iterator over paragraph texts
+        """
+        # Imported here since lxml is only needed for --fast-parse
+        from lxml import etree
+
+        for _, paragraph in etree.iterparse(stream, events=("end",), tag=_W_P):
+            parent = paragraph.getparent()
+            # Paragraphs nested in tables etc. are not part of doc.paragraphs
+            if parent is None or parent.tag != _W_BODY:
+                continue
+
+            text = self._paragraph_text(paragraph)
+            if text.strip():  # Skip empty paragraphs
+                yield text
+
+            # Free this paragraph and everything parsed before it
+            paragraph.clear()
+            while paragraph.getprevious() is not None:
+                del parent[0]
+
+    def _paragraph_text(self, paragraph) -> str:
+        """Text of a <w:p> element, following python-docx's Paragraph.text rules"""
+        parts = []
+
+        for child in paragraph:
+            if child.tag == _W_R:
+                runs = (child,)
+            elif child.tag == _W_HYPERLINK:
+                runs = child.iterchildren(_W_R)
+            else:
+                continue
+
+            for run in runs:
+                for node in run:
+                    if node.tag == _W_T:
+                        parts.append(node.text or "")
+                    elif node.tag == _W_BR:
+                        # Only line breaks count; page/column breaks have no text
+                        if node.get(_W_TYPE, "textWrapping") == "textWrapping":
+                            parts.append("\n")
+                    elif node.tag in _RUN_SPECIAL_CHARS:
+                        parts.append(_RUN_SPECIAL_CHARS[node.tag])
+
+        return "".join(parts)
+
+
 class DocumentProcessor:
     """Versatile processor for extracting and formatting Q&A content from DOCX documents"""
 
-    def __init__(self):
+    def __init__(self, fast_parse: bool = False):
+        """
+        Initialize document processor
+
+        Args:
+            fast_parse: Read DOCX files with the streaming FastDocxReader
+        """
+        self.fast_reader = FastDocxReader() if fast_parse else None
+
         # Multiple patterns to handle different Q&A formats
-        self.qa_patterns = [
+        qa_patterns = [
             r"Q:\s*(.*?)\s*A:\s*(.*?)(?=Q:|$)",  # Q: ... A: ... format
             r"Q\d+\s*(.*?)\s*A:\s*(.*?)(?=Q\d+|$)",  # Q1 ... A: ... format (NEW)
             r"Question:\s*(.*?)\s*Answer:\s*(.*?)(?=Question:|$)",  # Question: ... Answer: ...
             r"(\d+\.\s*.*?)\s*Answer:\s*(.*?)(?=\d+\.|$)",  # 1. Question Answer: ...
             r"(\d+\)\s*.*?)\s*Answer:\s*(.*?)(?=\d+\)|$)",  # 1) Question Answer: ...
-            r"([^\n]+\?)\s*([^Q\n]+?)(?=\n.*\?|$)",  # Question? Answer (natural format)
+        ]
+        # Question? Answer (natural format) is parsed line by line, see
+        # _iter_natural_pairs
+        # The text that opens a question and the marker that introduces its
+        # answer in each pattern above
+        qa_delimiters = [
+            (r"Q:", r"A:"),
+            (r"Q\d+", r"A:"),
+            (r"Question:", r"Answer:"),
+            (r"\d+\.", r"Answer:"),
+            (r"\d+\)", r"Answer:"),
+        ]
+        self.qa_patterns = [
+            tuple(
+                re.compile(regex, re.DOTALL | re.IGNORECASE)
+                for regex in (pattern, question_start, answer_start)
+            )
+            for pattern, (question_start, answer_start) in zip(
+                qa_patterns, qa_delimiters
+            )
         ]
 
     def read_docx(self, file_path: str) -> str:
@@ -37,45 +186,155 @@ class DocumentProcessor:
         Returns:
             Full text content as string
         """
+        if self.fast_reader is not None:
+            return self.fast_reader.read(file_path)
+
         try:
             doc = Document(file_path)
-            full_text = []
 
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():  # Skip empty paragraphs
-                    full_text.append(paragraph.text)
-
-            return "\n".join(full_text)
+            # paragraph.text rebuilds the text from the XML runs on every
+            # access, so read it once per paragraph
+            paragraph_texts = (paragraph.text for paragraph in doc.paragraphs)
+            return "\n".join(
+                text
+                for text in paragraph_texts
+                if text and not text.isspace()  # Skip empty paragraphs
+            )
         except Exception as e:
             raise ValueError(f"Error reading DOCX file {file_path}: {str(e)}")
 
-    def extract_qa_pairs(self, text: str) -> List[QAPair]:
+    def extract_qa_pairs(
+        self, text: str, first_format_only: bool = False
+    ) -> List[QAPair]:
         """
         Extract Q&A pairs from text using multiple patterns
 
         Args:
             text: Raw text content
+            first_format_only: Stop after the first format that yields any
+                pairs, for documents written in a single format
 
         Returns:
             List of QAPair objects
         """
         qa_pairs = []
+        seen_questions = set()  # Lowercased questions already extracted
 
-        for pattern in self.qa_patterns:
-            matches = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                question = self._clean_text(match[0])
-                answer = self._clean_text(match[1])
+        for format_pairs in self._iter_formats(text):
+            for raw_question, raw_answer in format_pairs:
+                question = self._clean_text(raw_question)
+                answer = self._clean_text(raw_answer)
 
                 if question and answer and len(question) > 5 and len(answer) > 5:
                     # Avoid duplicates
-                    if not any(
-                        qa.question.lower() == question.lower() for qa in qa_pairs
-                    ):
+                    question_key = question.lower()
+                    if question_key not in seen_questions:
+                        seen_questions.add(question_key)
                         qa_pairs.append(QAPair(question=question, answer=answer))
 
+            if first_format_only and qa_pairs:
+                break  # Remaining formats are never scanned
+
         return qa_pairs
 
+    def _iter_formats(self, text: str) -> Iterator[Iterator[Tuple[str, str]]]:
+        """Yield a lazy iterator of uncleaned (question, answer) candidates per format"""
+        for pattern, question_start, answer_start in self.qa_patterns:
+            yield self._iter_pattern_pairs(text, pattern, question_start, answer_start)
+
+        if "?" in text:
+            yield self._iter_natural_pairs(text)
+
+    def _iter_pattern_pairs(
+        self,
+        text: str,
+        pattern: re.Pattern,
+        question_start: re.Pattern,
+        answer_start: re.Pattern,
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield uncleaned (question, answer) candidates for a delimited format"""
+        last_answer_start = -1
+        for marker in answer_start.finditer(text):
+            last_answer_start = marker.start()
+
+        # A question opener with no answer marker after it cannot match,
+        # and trying it would make the pattern scan to the end of the
+        # text, once per opener. Openers before the last answer marker
+        # always match, so the pattern is only run from those.
+        pos = 0
+        while True:
+            opener = question_start.search(text, pos)
+            if opener is None or opener.end() > last_answer_start:
+                break
+            match = pattern.search(text, opener.start())
+            assert match is not None  # An answer marker follows the opener
+            yield match.group(1), match.group(2)
+            pos = match.end()
+
+    def _iter_natural_pairs(self, text: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield "Question? Answer" candidates by walking the text line by line
+
+        Gives the same pairs as the regex
+        ([^\\n]+\\?)\\s*([^Q\\n]+?)(?=\\n.*\\?|$) under DOTALL | IGNORECASE,
+        whose lookahead rescans the rest of the text for a "?" at every
+        candidate. A question runs from the start of a line to one of its
+        "?"s; the answer is the rest of that line, or of a following line
+        after blank space, contains no "q" and must be followed by a later
+        "?" or the end of the text.
+
+        Args:
+            text: Raw text content
+
+        Yields:
+            (question, answer) tuples of unclean text
+        """
+        length = len(text)
+        last_mark = text.rfind("?")
+        line_start = 0
+
+        while line_start < length:
+            line_end = text.find("\n", line_start)
+            if line_end == -1:
+                line_end = length
+
+            # Try the line's question marks from the last one back, and for
+            # each the answer starts from the first non-blank character back,
+            # the order in which the regex backtracks
+            span = None
+            mark = text.rfind("?", line_start + 1, line_end)
+            while span is None and mark != -1:
+                answer_from = mark + 1
+                blank_run = _WS_RUN_RE.match(text, answer_from)
+                assert blank_run is not None  # \s* matches the empty string
+                blank_end = blank_run.end()
+
+                for answer_start in range(blank_end, answer_from - 1, -1):
+                    if answer_start == length or text[answer_start] == "\n":
+                        continue
+                    answer_end = text.find("\n", answer_start)
+                    if answer_end == -1:
+                        answer_end = length
+                    answer = text[answer_start:answer_end]
+                    if "q" in answer or "Q" in answer:
+                        continue
+                    if answer_end >= length - 1 or last_mark > answer_end:
+                        span = answer_from, answer_start, answer_end
+                        break
+
+                # An answer found on this line only grows with an earlier
+                # question mark, so those cannot match either
+                if blank_end < line_end:
+                    break
+                mark = text.rfind("?", line_start + 1, mark)
+
+            if span is None:
+                line_start = line_end + 1
+            else:
+                question_end, answer_start, answer_end = span
+                yield text[line_start:question_end], text[answer_start:answer_end]
+                line_start = answer_end + 1
+
     def _clean_text(self, text: str) -> str:
         """
         Clean and normalize text for speech synthesis
@@ -86,17 +345,9 @@ class DocumentProcessor:
         Returns:
             Cleaned text
         """
-        # Remove extra whitespace and normalize
-        text = re.sub(r"\s+", " ", text.strip())
-
-        # Remove common document artifacts
-        text = re.sub(r"[\r\n]+", " ", text)
-        text = re.sub(r'\s*[""' "]\s*", '"', text)  # Normalize quotes
-        text = re.sub(r"\s*[–—]\s*", " - ", text)  # Normalize dashes
-
-        # Remove bullet points and numbering artifacts
-        text = re.sub(r"^\s*[\•·▪▫]\s*", "", text)
-        text = re.sub(r"^\s*\d+[\.\)]\s*", "", text)
+        # Normalize whitespace, quotes and dashes and remove leading bullet
+        # points and numbering artifacts in one pass
+        text = _CLEAN_RE.sub(_clean_replacement, text.strip())
 
         return text.strip()
 
@@ -121,7 +372,7 @@ class DocumentProcessor:
             return self._format_simple_style(qa_pairs)
 
     def create_speech_text_with_pauses(
-        self, qa_pairs: List[QAPair], format_style: str = "interview"
+        self, qa_pairs: List[QAPair], format_style: str = "interview", start: int = 1
     ) -> str:
         """
         Convert Q&A pairs to speech-optimized text with markup pauses for Google TTS
@@ -129,89 +380,110 @@ class DocumentProcessor:
         Args:
             qa_pairs: List of Q&A pairs
             format_style: Format style ('interview', 'dialogue', 'simple')
+            start: Number of the first question in the interview style
 
         Returns:
             Speech-ready text with pause markup
         """
         if format_style == "interview":
-            return self._format_interview_with_pauses(qa_pairs)
+            return self._format_interview_with_pauses(qa_pairs, start)
         elif format_style == "dialogue":
             return self._format_dialogue_with_pauses(qa_pairs)
         else:
             return self._format_simple_with_pauses(qa_pairs)
 
-    # Basic formatting methods (no markup)
-    def _format_interview_style(self, qa_pairs: List[QAPair]) -> str:
-        """Format as realistic interview dialogue"""
-        speech_parts = []
+    def create_speech_chunks_with_pauses(
+        self,
+        qa_pairs: List[QAPair],
+        format_style: str = "interview",
+        max_bytes: int = 4500,
+    ) -> List[str]:
+        """
+        Split speech text with pause markup into chunks of whole Q&A pairs
+
+        Each chunk holds as many consecutive Q&A pairs as fit in max_bytes of
+        UTF-8, so long documents need as few synthesis requests as possible.
+        Joined with spaces, the chunks give the same text as
+        create_speech_text_with_pauses.
+
+        Args:
+            qa_pairs: List of Q&A pairs
+            format_style: Format style ('interview', 'dialogue', 'simple')
+            max_bytes: Maximum UTF-8 size of a chunk (a single larger Q&A
+                pair still gets a chunk of its own)
+
+        Returns:
+            Speech-ready text chunks with pause markup
+        """
+        chunks = []
+        fragments: List[str] = []
+        chunk_bytes = 0
 
         for i, qa in enumerate(qa_pairs, 1):
-            speech_parts.append(f"Interview question {i}.")
-            speech_parts.append(qa.question)
-            speech_parts.append("Your response:")
-            speech_parts.append(qa.answer)
-            speech_parts.append("... ... ...")  # Spoken pause
+            fragment = self.create_speech_text_with_pauses([qa], format_style, start=i)
+            fragment_bytes = len(fragment.encode("utf-8"))
 
-        return " ".join(speech_parts)
+            # Fragments within a chunk are separated by one space
+            if fragments and chunk_bytes + 1 + fragment_bytes > max_bytes:
+                chunks.append(" ".join(fragments))
+                fragments = []
+                chunk_bytes = 0
 
-    def _format_dialogue_style(self, qa_pairs: List[QAPair]) -> str:
-        """Format as conversational dialogue"""
-        speech_parts = []
+            chunk_bytes += fragment_bytes + (1 if fragments else 0)
+            fragments.append(fragment)
 
-        for qa in qa_pairs:
-            speech_parts.append(f"Question: {qa.question}")
-            speech_parts.append(f"Answer: {qa.answer}")
-            speech_parts.append("... ... ...")  # Spoken pause
+        if fragments:
+            chunks.append(" ".join(fragments))
 
-        return " ".join(speech_parts)
+        return chunks
 
-    def _format_simple_style(self, qa_pairs: List[QAPair]) -> str:
-        """Simple concatenation with pauses"""
-        speech_parts = []
+    # Basic formatting methods (no markup)
+    def _format_interview_style(self, qa_pairs: List[QAPair]) -> str:
+        """Format as realistic interview dialogue"""
+        return " ".join(
+            f"Interview question {i}. {qa.question} Your response: {qa.answer}"
+            " ... ... ..."  # Spoken pause
+            for i, qa in enumerate(qa_pairs, 1)
+        )
 
-        for qa in qa_pairs:
-            speech_parts.append(qa.question)
-            speech_parts.append(qa.answer)
-            speech_parts.append("... ... ...")  # Spoken pause
+    def _format_dialogue_style(self, qa_pairs: List[QAPair]) -> str:
+        """Format as conversational dialogue"""
+        return " ".join(
+            f"Question: {qa.question} Answer: {qa.answer} ... ... ..."  # Spoken pause
+            for qa in qa_pairs
+        )
 
-        return " ".join(speech_parts)
+    def _format_simple_style(self, qa_pairs: List[QAPair]) -> str:
+        """Simple concatenation with pauses"""
+        return " ".join(
+            f"{qa.question} {qa.answer} ... ... ..." for qa in qa_pairs  # Spoken pause
+        )
 
     # Markup formatting methods (with Google TTS pause markup)
-    def _format_interview_with_pauses(self, qa_pairs: List[QAPair]) -> str:
+    def _format_interview_with_pauses(
+        self, qa_pairs: List[QAPair], start: int = 1
+    ) -> str:
         """Format as realistic interview dialogue with strategic pauses"""
-        speech_parts = []
-
-        for i, qa in enumerate(qa_pairs, 1):
-            speech_parts.append(f"Interview question {i}. [pause short]")
-            speech_parts.append(qa.question)
-            speech_parts.append("[pause long] Your response: [pause short]")
-            speech_parts.append(qa.answer)
-            speech_parts.append("[pause long]")  # Long pause between questions
-
-        return " ".join(speech_parts)
+        return " ".join(
+            f"Interview question {i}. [pause short] {qa.question}"
+            f" [pause long] Your response: [pause short] {qa.answer}"
+            " [pause long]"  # Long pause between questions
+            for i, qa in enumerate(qa_pairs, start)
+        )
 
     def _format_dialogue_with_pauses(self, qa_pairs: List[QAPair]) -> str:
         """Format as conversational dialogue with pauses"""
-        speech_parts = []
-
-        for qa in qa_pairs:
-            speech_parts.append(f"Question: [pause short] {qa.question}")
-            speech_parts.append(f"[pause medium] Answer: [pause short] {qa.answer}")
-            speech_parts.append("[pause long]")
-
-        return " ".join(speech_parts)
+        return " ".join(
+            f"Question: [pause short] {qa.question}"
+            f" [pause medium] Answer: [pause short] {qa.answer} [pause long]"
+            for qa in qa_pairs
+        )
 
     def _format_simple_with_pauses(self, qa_pairs: List[QAPair]) -> str:
         """Simple format with strategic pauses"""
-        speech_parts = []
-
-        for qa in qa_pairs:
-            speech_parts.append(qa.question)
-            speech_parts.append("[pause medium]")
-            speech_parts.append(qa.answer)
-            speech_parts.append("[pause long]")
-
-        return " ".join(speech_parts)
+        return " ".join(
+            f"{qa.question} [pause medium] {qa.answer} [pause long]" for qa in qa_pairs
+        )
 
     # Utility methods for reusability
     def get_qa_summary(self, qa_pairs: List[QAPair]) -> Dict[str, int]:
@@ -222,16 +494,16 @@ class DocumentProcessor:
             Dictionary with summary stats
         """
         total_questions = len(qa_pairs)
+        question_words = 0
+        answer_words = 0
+        for qa in qa_pairs:
+            question_words += len(qa.question.split())
+            answer_words += len(qa.answer.split())
+
         avg_question_length = (
-            sum(len(qa.question.split()) for qa in qa_pairs) / total_questions
-            if total_questions > 0
-            else 0
-        )
-        avg_answer_length = (
-            sum(len(qa.answer.split()) for qa in qa_pairs) / total_questions
-            if total_questions > 0
-            else 0
+            question_words / total_questions if total_questions > 0 else 0
         )
+        avg_answer_length = answer_words / total_questions if total_questions > 0 else 0
 
         return {
             "total_pairs": total_questions,
@@ -1,20 +1,56 @@
 from handlers_and_protocols.handlers import get_tts_handler
-from adapters.google_adapters.google_tts_adapter import GoogleVoicePresets
-from .document_processor import DocumentProcessor
+from adapters.google_adapters.google_tts_adapter import (
+    AudioFormat,
+    GoogleAudioConfig,
+    GoogleVoiceConfig,
+    GoogleVoicePresets,
+)
+from .document_processor import DocumentProcessor, QAPair
 from .audio_processor import AudioProcessor
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
 import logging
+import multiprocessing
 import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# CLI format names mapped to the encoding requested from the TTS service
+AUDIO_FORMATS = {"mp3": AudioFormat.MP3, "opus": AudioFormat.OGG_OPUS}
+
+
+@lru_cache(maxsize=None)
+def _get_handler(service: str, server_region: str):
+    """Return the TTS handler shared by every pipeline for a service and region"""
+    return get_tts_handler(service=service, server_region=server_region)
+
+
+def _extract_document(
+    docx_path: str, fast_parse: bool = False, first_format_only: bool = False
+) -> List[QAPair]:
+    """Read a document and extract its Q&A pairs (runs in worker processes)"""
+    doc_processor = DocumentProcessor(fast_parse=fast_parse)
+    return doc_processor.extract_qa_pairs(
+        doc_processor.read_docx(docx_path), first_format_only=first_format_only
+    )
+
 
 class TTSPipeline:
-    def __init__(self, service: str = "google", server_region: str = "us-central1"):
+    def __init__(
+        self,
+        service: str = "google",
+        server_region: str = "us-central1",
+        fast_parse: bool = False,
+        max_concurrency: int = 8,
+    ):
         self.service = service
-        self.doc_processor = DocumentProcessor()
-        self.tts_handler = get_tts_handler(service=service, server_region=server_region)
-        self.audio_processor = AudioProcessor()
+        self.fast_parse = fast_parse
+        self.doc_processor = DocumentProcessor(fast_parse=fast_parse)
+        self.tts_handler = _get_handler(service, server_region)
+        self.audio_processor = AudioProcessor(max_concurrency=max_concurrency)
 
     def process_document(
         self,
@@ -22,28 +58,146 @@ class TTSPipeline:
         output_name: str = "interview_dialogue",
         voice_preset: str = "professional_female",
         batch_mode: bool = False,
-    ) -> str:
+        audio_format: str = "mp3",
+        first_format_only: bool = False,
+    ) -> Union[str, List[str]]:
         logger.info(f"Processing document: {docx_path}")
+        voice_config, audio_config = self._resolve_configs(voice_preset, audio_format)
 
         # Step 1: Extract text and Q&A pairs
         text = self.doc_processor.read_docx(docx_path)
-        qa_pairs = self.doc_processor.extract_qa_pairs(text)
+        qa_pairs = self.doc_processor.extract_qa_pairs(
+            text, first_format_only=first_format_only
+        )
+
+        return self._generate_audio(
+            qa_pairs, output_name, voice_config, audio_config, batch_mode
+        )
+
+    def process_documents(
+        self,
+        docx_paths: List[str],
+        voice_preset: str = "professional_female",
+        batch_mode: bool = False,
+        audio_format: str = "mp3",
+        max_workers: Optional[int] = None,
+        first_format_only: bool = False,
+    ) -> List[Optional[Union[str, List[str]]]]:
+        """
+        Process several documents, extracting their Q&A pairs in parallel
+
+        Reading and extraction are CPU-bound and run in a process pool. Audio
+        is generated here, one document after another, so every document
+        shares this pipeline's TTS client. Output files are named after their
+        document, with the document's position appended when several
+        documents share a file name.
+
+        Args:
+            docx_paths: Paths to the DOCX files
+            voice_preset: Voice preset to use
+            batch_mode: Create separate files for each Q&A pair
+            audio_format: Audio output format ('mp3' or 'opus')
+            max_workers: Number of extraction processes (default: CPU count)
+            first_format_only: Stop extracting after the first Q&A format found
+                in each document
+
+        Returns:
+            Result of process_document for each document, in input order;
+            None for a document that could not be processed (the error is
+            logged as a warning)
+        """
+        # Settings shared by every document are checked once, before any work
+        voice_config, audio_config = self._resolve_configs(voice_preset, audio_format)
+
+        # Workers are spawned rather than forked: this process already holds a
+        # live gRPC channel, and gRPC does not support fork() while it is in use
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            extract = partial(
+                _extract_document,
+                fast_parse=self.fast_parse,
+                first_format_only=first_format_only,
+            )
+            futures = [executor.submit(extract, path) for path in docx_paths]
+
+        results: List[Optional[Union[str, List[str]]]] = []
+        used_names = set()
+        for i, (docx_path, future) in enumerate(zip(docx_paths, futures), 1):
+            # Documents with the same file name get their input position
+            # appended so they do not overwrite each other's output
+            output_name = Path(docx_path).stem
+            if output_name in used_names:
+                output_name = f"{output_name}_{i}"
+                while output_name in used_names:
+                    output_name = f"{output_name}_{i}"
+            used_names.add(output_name)
+
+            # A document that fails (unreadable, no Q&A pairs, a synthesis or
+            # worker error) is skipped so the rest of the batch still runs
+            try:
+                qa_pairs = future.result()
+                logger.info(f"Generating audio for document: {docx_path}")
+                results.append(
+                    self._generate_audio(
+                        qa_pairs,
+                        output_name,
+                        voice_config,
+                        audio_config,
+                        batch_mode,
+                        batch_prefix=f"{output_name}_qa",
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Skipping document {docx_path}: {e}")
+                results.append(None)
 
+        return results
+
+    def _resolve_configs(
+        self, voice_preset: str, audio_format: str
+    ) -> Tuple[GoogleVoiceConfig, GoogleAudioConfig]:
+        """Look up the voice preset and audio format, rejecting unknown names"""
+        try:
+            voice_config = GoogleVoicePresets.get(voice_preset)
+        except KeyError:
+            raise ValueError(
+                f"Unknown voice preset: {voice_preset}. "
+                f"Available: {', '.join(GoogleVoicePresets.chirp3_names())}"
+            )
+        if audio_format not in AUDIO_FORMATS:
+            raise ValueError(
+                f"Unknown audio format: {audio_format}. "
+                f"Available: {', '.join(AUDIO_FORMATS)}"
+            )
+        return voice_config, GoogleAudioConfig(format=AUDIO_FORMATS[audio_format])
+
+    def _generate_audio(
+        self,
+        qa_pairs: List[QAPair],
+        output_name: str,
+        voice_config: GoogleVoiceConfig,
+        audio_config: GoogleAudioConfig,
+        batch_mode: bool,
+        batch_prefix: str = "qa_pair",
+    ) -> Union[str, List[str]]:
+        """Synthesize audio for extracted Q&A pairs"""
         if not qa_pairs:
             raise ValueError("No Q&A pairs found in document.")
 
         logger.info(f"Found {len(qa_pairs)} Q&A pairs")
 
-        # Step 2: Get voice configuration
-        voice_config = getattr(GoogleVoicePresets, voice_preset)()
-
-        # Step 3: Generate audio
+        # Step 2: Generate audio
         if batch_mode:
-            return self._process_batch_mode(qa_pairs, output_name, voice_config)
+            return self._process_batch_mode(
+                qa_pairs, output_name, voice_config, audio_config, batch_prefix
+            )
         else:
-            return self._process_single_mode(qa_pairs, output_name, voice_config)
+            return self._process_single_mode(
+                qa_pairs, output_name, voice_config, audio_config
+            )
 
-    def _process_single_mode(self, qa_pairs, output_name, voice_config):
+    def _process_single_mode(self, qa_pairs, output_name, voice_config, audio_config):
         """Create single audio file, with automatic batching for long content"""
 
         # Create speech text with pauses
@@ -51,8 +205,15 @@ class TTSPipeline:
             qa_pairs, "interview"
         )
 
-        # Check size before attempting synthesis
-        text_bytes = len(speech_text.encode("utf-8"))
+        # Check size before attempting synthesis. ASCII text (the usual case)
+        # is one byte per character, so only other text needs encoding; the
+        # encoded bytes are then sent as-is and the client does not re-encode.
+        if speech_text.isascii():
+            speech_payload = speech_text
+            text_bytes = len(speech_text)
+        else:
+            speech_payload = speech_text.encode("utf-8")
+            text_bytes = len(speech_payload)
         logger.info(f"Generating audio for {len(qa_pairs)} Q&A pairs...")
         logger.info(f"Speech text: {len(speech_text)} characters, {text_bytes} bytes")
 
@@ -61,53 +222,53 @@ class TTSPipeline:
             logger.warning(f"Text exceeds Google TTS limit ({text_bytes} > 4500 bytes)")
             logger.info("Automatically switching to batch-and-combine mode...")
             return self._process_single_mode_with_batching(
-                qa_pairs, output_name, voice_config
+                qa_pairs, output_name, voice_config, audio_config
             )
 
         # If under limit, proceed normally
         logger.info("Text under limit, using single synthesis...")
-        audio_content = self.tts_handler.synthesize_text(speech_text, voice_config)
+        audio_content = self.tts_handler.synthesize_text(
+            speech_payload, voice_config, audio_config
+        )
 
         output_path = self.audio_processor.save_audio(
-            audio_content, output_name, format="mp3"
+            audio_content, output_name, format=audio_config.format.file_extension
         )
         logger.info(f"Audio saved to: {output_path}")
 
         return output_path
 
-    def _process_single_mode_with_batching(self, qa_pairs, output_name, voice_config):
-        """Create single file by generating and combining individual Q&A audio files"""
+    def _process_single_mode_with_batching(
+        self, qa_pairs, output_name, voice_config, audio_config
+    ):
+        """Create single file by synthesizing chunks of Q&As and combining them"""
+        extension = audio_config.format.file_extension
 
-        logger.info("Creating individual audio files for each Q&A...")
+        # Pack as many whole Q&As into each request as the size limit allows
+        chunks = self.doc_processor.create_speech_chunks_with_pauses(
+            qa_pairs, "interview", max_bytes=4500
+        )
+        logger.info(
+            f"Creating {len(chunks)} audio files for {len(qa_pairs)} Q&A pairs..."
+        )
 
-        # Generate individual files
-        temp_files = self.audio_processor.create_batch_files(
-            qa_pairs=qa_pairs,
-            tts_handler=self.tts_handler,
+        # Generate one file per chunk
+        temp_files = self.audio_processor.create_text_files(
+            chunks,
+            self.tts_handler,
             voice_config=voice_config,
+            audio_config=audio_config,
             filename_prefix="temp_qa",
+            format=extension,
         )
 
         logger.info(f"Combining {len(temp_files)} audio files...")
 
-        # Combine all files into one
+        # Combine all files into one. Every chunk already ends with a long
+        # pause, as in single synthesis, so no extra silence is added.
         try:
-            from pydub import AudioSegment
-
-            combined = AudioSegment.empty()
-
-            for i, file_path in enumerate(temp_files):
-                logger.debug(f"Adding file {i+1}/{len(temp_files)}: {file_path}")
-                audio_segment = AudioSegment.from_mp3(file_path)
-                combined += audio_segment
-
-                # Add pause between Q&As (except after last one)
-                if i < len(temp_files) - 1:
-                    combined += AudioSegment.silent(duration=1500)  # 1.5 second pause
-
-            # Export combined audio
-            output_path = self.audio_processor.save_audio(
-                combined.export(format="mp3").read(), output_name, format="mp3"
+            output_path = self.audio_processor.combine_audio_files(
+                temp_files, output_name, format=extension
             )
 
             # Clean up temporary files
@@ -121,9 +282,9 @@ class TTSPipeline:
             logger.info(f"Combined audio saved to: {output_path}")
             return output_path
 
-        except ImportError:
-            logger.error("pydub is required for combining audio files")
-            logger.info("Install with: pip install pydub")
+        except FileNotFoundError:
+            logger.error("ffmpeg is required for combining audio files")
+            logger.info("Install ffmpeg and make sure it is on PATH")
             logger.info(f"Individual files saved as: {temp_files}")
             return temp_files
         except Exception as e:
@@ -131,11 +292,23 @@ class TTSPipeline:
             logger.info(f"Individual files saved as: {temp_files}")
             return temp_files
 
-    def _process_batch_mode(self, qa_pairs, output_name, voice_config):
+    def _process_batch_mode(
+        self,
+        qa_pairs,
+        output_name,
+        voice_config,
+        audio_config,
+        filename_prefix="qa_pair",
+    ):
         logger.info("Generating batch audio files...")
 
         file_paths = self.audio_processor.create_batch_files(
-            qa_pairs, self.tts_handler, voice_config=voice_config
+            qa_pairs,
+            self.tts_handler,
+            voice_config=voice_config,
+            filename_prefix=filename_prefix,
+            audio_config=audio_config,
+            format=audio_config.format.file_extension,
         )
 
         logger.info(f"Created {len(file_paths)} audio files")
@@ -9,7 +9,7 @@ client = texttospeech.TextToSpeechClient()
 
 # Exact copy from Google's example
 # prompt = "Hello world! I am Chirp 3"
-prompt = utils.load_object_from_pickle("QApair1.pkl")
+prompt = utils.load_object_from_json("QApair1.json")
 print(f"aaaaaaaaaaaaaaaa prompt: {prompt}")
 voice = "Charon"
 language_code = "en-US"
@@ -22,17 +22,27 @@ voice = texttospeech.VoiceSelectionParams(
     language_code=language_code,
 )
 
-response = client.synthesize_speech(
-    input=texttospeech.SynthesisInput(text=prompt),
+# Stream the audio to disk as it arrives instead of holding the whole
+# response in memory. Streaming supports PCM, ALAW, MULAW and OGG_OPUS only
+# (no MP3), and has no volume gain setting.
+streaming_config = texttospeech.StreamingSynthesizeConfig(
     voice=voice,
-    audio_config=texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.MP3,
+    streaming_audio_config=texttospeech.StreamingAudioConfig(
+        audio_encoding=texttospeech.AudioEncoding.OGG_OPUS,
         sample_rate_hertz=24000,
         speaking_rate=0.9,
-        volume_gain_db=2.0,
     ),
 )
+requests = iter(
+    [
+        texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config),
+        texttospeech.StreamingSynthesizeRequest(
+            input=texttospeech.StreamingSynthesisInput(text=prompt)
+        ),
+    ]
+)
 
-with open("test_output.mp3", "wb") as out:
-    out.write(response.audio_content)
-    print("✅ Success! Audio saved to test_output.mp3")
+with open("test_output.ogg", "wb") as out:
+    for response in client.streaming_synthesize(requests=requests):
+        out.write(response.audio_content)
+    print("✅ Success! Audio saved to test_output.ogg")
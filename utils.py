@@ -1,14 +1,14 @@
-import pickle
+import json
 
 
-def save_object_to_pickle(object: str, file_path: str) -> None:
-    """Save transcription object to a pickle file."""
-    with open(file_path, "wb") as f:
-        pickle.dump(object, f)
-    print("pickle file saved")
+def save_object_to_json(object: str, file_path: str) -> None:
+    """Save transcription object to a JSON file."""
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(object, f, ensure_ascii=False)
+    print("json file saved")
 
 
-def load_object_from_pickle(file_path: str) -> any:
-    """Load transcription object from a pickle file."""
-    with open(file_path, "rb") as f:
-        return pickle.load(f)
+def load_object_from_json(file_path: str) -> any:
+    """Load transcription object from a JSON file."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)